@@ -14,18 +14,30 @@
 #  limitations under the License.
 
 import json
-import os.path
 
-from robot.running import ArgInfo, ArgumentSpec
-from robot.errors import DataError
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from robot.running import ArgumentSpec
 
 from .datatypes import CustomDoc, EnumDoc, EnumMember, TypedDictDoc, TypedDictItem
 from .model import LibraryDoc, KeywordDoc
+from .speccache import spec_cache
+from .specutils import apply_arg, open_spec
 
 
 class JsonDocBuilder:
 
     def build(self, path):
+        return spec_cache.get(path, self._build)
+
+    def _build(self, path):
         spec = self._parse_spec_json(path)
         return self.build_from_dict(spec)
 
@@ -37,18 +49,20 @@ class JsonDocBuilder:
                             scope=spec['scope'],
                             doc_format=spec['docFormat'],
                             source=spec['source'],
-                            lineno=int(spec.get('lineno', -1)))
+                            lineno=spec.get('lineno', -1))
         libdoc.inits = [self._create_keyword(kw) for kw in spec['inits']]
         libdoc.keywords = [self._create_keyword(kw) for kw in spec['keywords']]
         libdoc.data_types.types = set(self._create_data_types(spec['dataTypes']))
         return libdoc
 
     def _parse_spec_json(self, path):
-        if not os.path.isfile(path):
-            raise DataError("Spec file '%s' does not exist." % path)
-        with open(path) as json_source:
-            libdoc_dict = json.load(json_source)
-        return libdoc_dict
+        with open_spec(path) as json_source:
+            data = json_source.read()
+        if simdjson:
+            # A new parser is needed for each spec because a parser cannot be
+            # reused as long as objects from its earlier document are alive.
+            return simdjson.Parser().parse(data)
+        return orjson.loads(data) if orjson else json.loads(data)
 
     def _create_keyword(self, kw):
         return KeywordDoc(name=kw.get('name'),
@@ -57,39 +71,28 @@ class JsonDocBuilder:
                           shortdoc=kw['shortdoc'],
                           tags=kw['tags'],
                           source=kw['source'],
-                          lineno=int(kw.get('lineno', -1)))
+                          lineno=kw.get('lineno', -1))
 
     def _create_arguments(self, arguments):
-        spec = ArgumentSpec()
-        setters = {
-            ArgInfo.POSITIONAL_ONLY: spec.positional_only.append,
-            ArgInfo.POSITIONAL_ONLY_MARKER: lambda value: None,
-            ArgInfo.POSITIONAL_OR_NAMED: spec.positional_or_named.append,
-            ArgInfo.VAR_POSITIONAL: lambda value: setattr(spec, 'var_positional', value),
-            ArgInfo.NAMED_ONLY_MARKER: lambda value: None,
-            ArgInfo.NAMED_ONLY: spec.named_only.append,
-            ArgInfo.VAR_NAMED: lambda value: setattr(spec, 'var_named', value),
-        }
+        spec = ArgumentSpec(types={})
+        set_default = spec.defaults.__setitem__
+        set_types = spec.types.__setitem__
         for arg in arguments:
             name = arg['name']
-            setters[arg['kind']](name)
+            apply_arg(spec, arg['kind'], name)
             default = arg.get('defaultValue')
             if default is not None:
-                spec.defaults[name] = default
-            arg_types = arg['types']
-            if not spec.types:
-                spec.types = {}
-            spec.types[name] = tuple(arg_types)
+                set_default(name, default)
+            set_types(name, tuple(arg['types']))
         return spec
 
     def _create_data_types(self, data_types):
-        enums = [self._create_enum_doc(dt)
-                 for dt in data_types.get('enums', [])]
-        typed_dicts = [self._create_typed_dict_doc(dt)
-                       for dt in data_types.get('typedDicts', [])]
-        customs = [self._create_custom_doc(dt)
-                   for dt in data_types.get('customs', [])]
-        return enums + typed_dicts + customs
+        for dt in data_types.get('enums', []):
+            yield self._create_enum_doc(dt)
+        for dt in data_types.get('typedDicts', []):
+            yield self._create_typed_dict_doc(dt)
+        for dt in data_types.get('customs', []):
+            yield self._create_custom_doc(dt)
 
     def _create_enum_doc(self, data):
         return EnumDoc(name=data['name'],
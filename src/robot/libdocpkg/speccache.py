@@ -0,0 +1,95 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import copy
+import os
+import threading
+from collections import OrderedDict
+
+
+class SpecCache:
+    """Caches libraries built from spec files.
+
+    Cache keys contain the modification time and size of the spec file, so
+    a changed file is always built again. Cached libraries are returned as
+    copies to prevent modifications, for example converting documentation
+    to HTML, from affecting later builds. Keywords, their arguments and tags
+    as well as data types are copied.
+
+    Caching can be disabled by setting the ``ROBOT_LIBDOC_NOCACHE``
+    environment variable to any non-empty value. That is needed if spec files
+    are changed without their modification time or size changing.
+    """
+
+    def __init__(self, max_size=64):
+        self.max_size = max_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path, build):
+        if os.getenv('ROBOT_LIBDOC_NOCACHE'):
+            return build(path)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return build(path)
+        key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            libdoc = self._cache.get(key)
+            if libdoc is not None:
+                self._cache.move_to_end(key)
+        if libdoc is None:
+            # Building is done without the lock so that a slow build does not
+            # block others. Concurrent builds of the same spec are harmless.
+            libdoc = build(path)
+            with self._lock:
+                self._cache[key] = libdoc
+                while len(self._cache) > self.max_size:
+                    self._cache.popitem(last=False)
+        return self._copy(libdoc)
+
+    def _copy(self, libdoc):
+        copied = copy.copy(libdoc)
+        copied.data_types = copy.copy(libdoc.data_types)
+        copied.data_types.types = {copy.deepcopy(t) for t in libdoc.data_types.types}
+        copied.inits = [self._copy_keyword(kw) for kw in libdoc.inits]
+        copied.keywords = [self._copy_keyword(kw) for kw in libdoc.keywords]
+        return copied
+
+    def _copy_keyword(self, kw):
+        copied = copy.copy(kw)
+        copied.args = self._copy_arguments(kw.args)
+        copied.tags = copy.copy(kw.tags)
+        return copied
+
+    def _copy_arguments(self, args):
+        copied = copy.copy(args)
+        copied.positional_only = list(args.positional_only)
+        copied.positional_or_named = list(args.positional_or_named)
+        copied.named_only = list(args.named_only)
+        copied.defaults = dict(args.defaults)
+        if args.types is not None:
+            # Types are updated in place to avoid validating them again.
+            # Spec files can contain types also for argument markers.
+            copied.types = {}
+            copied.types.update(args.types)
+        return copied
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+
+spec_cache = SpecCache()
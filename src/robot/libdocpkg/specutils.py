@@ -0,0 +1,58 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import os.path
+
+from robot.errors import DataError
+from robot.running import ArgInfo
+
+
+POSITIONAL_ONLY = ArgInfo.POSITIONAL_ONLY
+POSITIONAL_OR_NAMED = ArgInfo.POSITIONAL_OR_NAMED
+VAR_POSITIONAL = ArgInfo.VAR_POSITIONAL
+NAMED_ONLY = ArgInfo.NAMED_ONLY
+VAR_NAMED = ArgInfo.VAR_NAMED
+
+
+def apply_arg(spec, kind, name):
+    """Adds argument ``name`` with the given ``kind`` to the argument ``spec``.
+
+    Argument markers and unknown kinds are ignored.
+    """
+    if kind == POSITIONAL_OR_NAMED:
+        spec.positional_or_named.append(name)
+    elif kind == NAMED_ONLY:
+        spec.named_only.append(name)
+    elif kind == POSITIONAL_ONLY:
+        spec.positional_only.append(name)
+    elif kind == VAR_POSITIONAL:
+        spec.var_positional = name
+    elif kind == VAR_NAMED:
+        spec.var_named = name
+
+
+def open_spec(path):
+    """Opens spec file ``path`` in binary mode.
+
+    Raises a :class:`~robot.errors.DataError` if the path is not a file.
+    """
+    try:
+        return open(path, 'rb')
+    except OSError:
+        # Opening a directory fails with different errors on different
+        # platforms, so the path is checked only after opening fails.
+        if not os.path.isfile(path):
+            raise DataError("Spec file '%s' does not exist." % path)
+        raise
@@ -13,114 +13,188 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-import os.path
+import sys
 
 from robot.errors import DataError
-from robot.running import ArgInfo, ArgumentSpec
-from robot.utils import ET, ETSource
+from robot.running import ArgumentSpec
 
 from .model import LibraryDoc, KeywordDoc
 from .datatypes import CustomDoc, EnumDoc, EnumMember, TypedDictDoc, TypedDictItem
+from .speccache import spec_cache
+from .specutils import apply_arg, open_spec
+
+try:
+    from lxml import etree as ET
+except ImportError:
+    from robot.utils import ET
+    _lxml = False
+    _iterparse_options = {}
+else:
+    _lxml = True
+    # Entities are never resolved and network access is disabled, like with
+    # ElementTree, regardless of the lxml version.
+    _iterparse_options = {'collect_ids': False, 'remove_blank_text': True,
+                          'huge_tree': False, 'resolve_entities': False,
+                          'no_network': True}
+
+
+def _intern(text):
+    return sys.intern(text) if text else text
 
 
 class XmlDocBuilder:
 
     def build(self, path):
-        spec = self._parse_spec(path)
-        libdoc = LibraryDoc(name=spec.get('name'),
-                            type=spec.get('type').upper(),
-                            version=spec.find('version').text or '',
-                            doc=spec.find('doc').text or '',
-                            scope=spec.get('scope'),
-                            doc_format=spec.get('format') or 'ROBOT',
-                            source=spec.get('source'),
-                            lineno=int(spec.get('lineno')) or -1)
-        libdoc.inits = self._create_keywords(spec, 'inits/init', libdoc.source)
-        libdoc.keywords = self._create_keywords(spec, 'keywords/kw', libdoc.source)
-        libdoc.data_types.types = set(self._create_data_types(spec))
+        return spec_cache.get(path, self._build)
+
+    def _build(self, path):
+        spec = None
+        info = {'version': '', 'doc': ''}
+        inits = []
+        keywords = []
+        data_types = []
+        parents = []
+        with open_spec(path) as source:
+            for event, elem in ET.iterparse(source, events=('start', 'end'),
+                                            **_iterparse_options):
+                if event == 'start':
+                    if not parents:
+                        spec = self._validate_spec(elem, path)
+                    parents.append(elem.tag)
+                    continue
+                parents.pop()
+                parent = parents[-1] if parents else None
+                tag = elem.tag
+                if parent == 'keywordspec':
+                    if tag in info:
+                        info[tag] = elem.text or ''
+                    continue
+                if parent == 'inits' and tag == 'init':
+                    inits.append(self._create_keyword(elem, spec['source']))
+                elif parent == 'keywords' and tag == 'kw':
+                    keywords.append(self._create_keyword(elem, spec['source']))
+                elif parent == 'enums' and tag == 'enum':
+                    data_types.append(self._create_enum_doc(elem))
+                elif parent == 'typeddicts' and tag == 'typeddict':
+                    data_types.append(self._create_typed_dict_doc(elem))
+                elif parent == 'customs' and tag == 'custom':
+                    data_types.append(self._create_custom_doc(elem))
+                else:
+                    continue
+                self._release(elem)
+        lineno = spec['lineno']
+        libdoc = LibraryDoc(name=spec['name'],
+                            type=spec['type'].upper(),
+                            version=info['version'],
+                            doc=info['doc'],
+                            scope=spec['scope'],
+                            doc_format=spec['format'] or 'ROBOT',
+                            source=spec['source'],
+                            lineno=int(lineno) if lineno else -1)
+        libdoc.inits = inits
+        libdoc.keywords = keywords
+        libdoc.data_types.types = set(data_types)
         return libdoc
 
-    def _parse_spec(self, path):
-        if not os.path.isfile(path):
-            raise DataError("Spec file '%s' does not exist." % path)
-        with ETSource(path) as source:
-            root = ET.parse(source).getroot()
+    def _validate_spec(self, root, path):
         if root.tag != 'keywordspec':
             raise DataError("Invalid spec file '%s'." % path)
         version = root.get('specversion')
         if version not in ('3', '4'):
             raise DataError(f"Invalid spec file version '{version}'. "
                             f"Supported versions are 3 and 4.")
-        return root
+        return {name: root.get(name) for name in
+                ('name', 'type', 'scope', 'format', 'source', 'lineno')}
 
-    def _create_keywords(self, spec, path, lib_source):
-        return [self._create_keyword(elem, lib_source) for elem in spec.findall(path)]
+    def _release(self, elem):
+        # Parsed elements are not needed anymore. Dropping them keeps memory
+        # usage bounded also with big spec files.
+        elem.clear()
+        if _lxml:
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
 
     def _create_keyword(self, elem, lib_source):
         # "deprecated" attribute isn't read because it is read from the doc
         # automatically. That should probably be changed at some point.
+        doc = shortdoc = ''
+        tags = []
+        arguments = ()
+        for child in elem:
+            tag = child.tag
+            if tag == 'doc':
+                doc = child.text or ''
+            elif tag == 'shortdoc':
+                shortdoc = child.text or ''
+            elif tag == 'tags':
+                tags = [_intern(t.text) for t in child if t.tag == 'tag']
+            elif tag == 'arguments':
+                arguments = child
+        lineno = elem.get('lineno')
         return KeywordDoc(name=elem.get('name', ''),
-                          args=self._create_arguments(elem),
-                          doc=elem.find('doc').text or '',
-                          shortdoc=elem.find('shortdoc').text or '',
-                          tags=[t.text for t in elem.findall('tags/tag')],
+                          args=self._create_arguments(arguments),
+                          doc=doc,
+                          shortdoc=shortdoc,
+                          tags=tags,
                           source=elem.get('source') or lib_source,
-                          lineno=int(elem.get('lineno', -1)))
-
-    def _create_arguments(self, elem):
-        spec = ArgumentSpec()
-        setters = {
-            ArgInfo.POSITIONAL_ONLY: spec.positional_only.append,
-            ArgInfo.POSITIONAL_ONLY_MARKER: lambda value: None,
-            ArgInfo.POSITIONAL_OR_NAMED: spec.positional_or_named.append,
-            ArgInfo.VAR_POSITIONAL: lambda value: setattr(spec, 'var_positional', value),
-            ArgInfo.NAMED_ONLY_MARKER: lambda value: None,
-            ArgInfo.NAMED_ONLY: spec.named_only.append,
-            ArgInfo.VAR_NAMED: lambda value: setattr(spec, 'var_named', value),
-        }
-        for arg in elem.findall('arguments/arg'):
-            name_elem = arg.find('name')
-            if name_elem is None:
+                          lineno=int(lineno) if lineno else -1)
+
+    def _create_arguments(self, arguments):
+        spec = ArgumentSpec(types={})
+        set_default = spec.defaults.__setitem__
+        set_types = spec.types.__setitem__
+        for arg in arguments:
+            if arg.tag != 'arg':
+                continue
+            name = default = None
+            types = []
+            for child in arg:
+                tag = child.tag
+                if tag == 'name':
+                    name = child.text
+                elif tag == 'default':
+                    default = child.text or ''
+                elif tag == 'type':
+                    types.append(_intern(child.text))
+            if name is None:
                 continue
-            name = name_elem.text
-            setters[arg.get('kind')](name)
-            default_elem = arg.find('default')
-            if default_elem is not None:
-                spec.defaults[name] = default_elem.text or ''
-            type_elems = arg.findall('type')
-            if not spec.types:
-                spec.types = {}
-            spec.types[name] = tuple(t.text for t in type_elems)
+            apply_arg(spec, arg.get('kind'), name)
+            if default is not None:
+                set_default(name, default)
+            set_types(name, tuple(types))
         return spec
 
-    def _create_data_types(self, spec):
-        enums = [self._create_enum_doc(dt)
-                 for dt in spec.findall('datatypes/enums/enum')]
-        typed_dicts = [self._create_typed_dict_doc(dt)
-                       for dt in spec.findall('datatypes/typeddicts/typeddict')]
-        custom = [self._create_custom_doc(dt)
-                  for dt in spec.findall('datatypes/customs/custom')]
-        return enums + typed_dicts + custom
-
     def _create_enum_doc(self, elem):
-        return EnumDoc(name=elem.get('name'),
-                       doc=elem.find('doc').text or '',
-                       members=[EnumMember(name=member.get('name'),
-                                           value=member.get('value'))
-                                for member in elem.findall('members/member')])
+        doc = ''
+        members = []
+        for child in elem:
+            tag = child.tag
+            if tag == 'doc':
+                doc = child.text or ''
+            elif tag == 'members':
+                members = [EnumMember(m.get('name'), m.get('value'))
+                           for m in child if m.tag == 'member']
+        return EnumDoc(name=elem.get('name'), doc=doc, members=members)
 
     def _create_typed_dict_doc(self, elem):
+        doc = ''
         items = []
-        for item in elem.findall('items/item'):
-            required = item.get('required', None)
-            if required is not None:
-                required = required == 'true'
-            items.append(TypedDictItem(key=item.get('key'),
-                                       type=item.get('type'),
-                                       required=required))
-        return TypedDictDoc(name=elem.get('name'),
-                            doc=elem.find('doc').text or '',
-                            items=items)
+        for child in elem:
+            tag = child.tag
+            if tag == 'doc':
+                doc = child.text or ''
+            elif tag == 'items':
+                items = [self._create_typed_dict_item(item) for item in child
+                         if item.tag == 'item']
+        return TypedDictDoc(name=elem.get('name'), doc=doc, items=items)
+
+    def _create_typed_dict_item(self, item):
+        required = item.get('required', None)
+        if required is not None:
+            required = required == 'true'
+        return TypedDictItem(key=item.get('key'),
+                             type=_intern(item.get('type')),
+                             required=required)
 
     def _create_custom_doc(self, elem):
         return CustomDoc(name=elem.get('name'),
@@ -1,5 +1,6 @@
 import json
 import os
+import shutil
 from os.path import dirname, join, normpath
 import unittest
 import tempfile
@@ -7,10 +8,14 @@ import tempfile
 from jsonschema import validate
 
 from robot.utils import PY_VERSION
-from robot.utils.asserts import assert_equal
+from robot.utils.asserts import assert_equal, assert_raises_with_msg
 from robot.libdocpkg import LibraryDocumentation
 from robot.libdocpkg.model import LibraryDoc, KeywordDoc
 from robot.libdocpkg.htmlutils import HtmlToText, DocToHtml
+from robot.errors import DataError
+from robot.libdocpkg.jsonbuilder import JsonDocBuilder
+from robot.libdocpkg.xmlbuilder import XmlDocBuilder
+from robot.libdocpkg.speccache import SpecCache
 
 get_shortdoc = HtmlToText().get_shortdoc_from_html
 get_text = HtmlToText().html_to_plain_text
@@ -281,6 +286,96 @@ class TestXmlSpec(unittest.TestCase):
         self.assertDictEqual(orig_data, spec_data)
 
 
+class TestInvalidSpecPath(unittest.TestCase):
+
+    def test_non_existing(self):
+        for builder in JsonDocBuilder(), XmlDocBuilder():
+            path = join(TEMPDIR, 'libdoc-utest-nonex.spec')
+            assert_raises_with_msg(DataError, f"Spec file '{path}' does not exist.",
+                                   builder.build, path)
+
+    def test_directory(self):
+        for builder in JsonDocBuilder(), XmlDocBuilder():
+            assert_raises_with_msg(DataError, f"Spec file '{TEMPDIR}' does not exist.",
+                                   builder.build, TEMPDIR)
+
+
+class TestSpecCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = SpecCache(max_size=1)
+        self.builds = []
+
+    def _build(self, path):
+        self.builds.append(path)
+        return LibraryDocumentation(path)
+
+    def test_cached_library_is_returned_as_copy(self):
+        path = join(DATADIR, 'DataTypesLibrary.xml')
+        first = self.cache.get(path, self._build)
+        orig_doc = first.keywords[0].doc
+        first.convert_docs_to_html()
+        second = self.cache.get(path, self._build)
+        assert_equal(self.builds, [path])
+        assert_equal(second.doc_format, 'ROBOT')
+        assert_equal(second.keywords[0].doc, orig_doc)
+        assert_equal(second.keywords[0].parent, second)
+        assert_equal(second.data_types.types, first.data_types.types)
+
+    def test_modifying_copy_does_not_affect_cache(self):
+        path = join(DATADIR, 'DataTypesLibrary.xml')
+        first = self.cache.get(path, self._build)
+        kw = first.keywords[0]
+        orig_defaults = dict(kw.args.defaults)
+        orig_tags = list(kw.tags)
+        kw.args.defaults['x'] = 'MUTATED'
+        kw.args.positional_or_named.append('x')
+        kw.tags.add('mutated')
+        enum = first.data_types.enums[0]
+        orig_members = [m.name for m in enum.members]
+        enum.members.append(enum.members[0])
+        second = self.cache.get(path, self._build)
+        assert_equal(second.keywords[0].args.defaults, orig_defaults)
+        assert_equal(list(second.keywords[0].tags), orig_tags)
+        assert_equal([m.name for m in second.data_types.enums[0].members],
+                     orig_members)
+        assert_equal(self.builds, [path])
+
+    def test_changed_file_is_built_again(self):
+        path = join(TEMPDIR, 'libdoc-utest-cached.xml')
+        shutil.copy(join(DATADIR, 'DataTypesLibrary.xml'), path)
+        self.addCleanup(os.remove, path)
+        self.cache.get(path, self._build)
+        self.cache.get(path, self._build)
+        assert_equal(self.builds, [path])
+        mtime = os.stat(path).st_mtime_ns
+        os.utime(path, ns=(mtime + 10**9, mtime + 10**9))
+        self.cache.get(path, self._build)
+        assert_equal(self.builds, [path, path])
+        with open(path, 'a') as f:
+            f.write('\n')
+        os.utime(path, ns=(mtime + 10**9, mtime + 10**9))
+        self.cache.get(path, self._build)
+        assert_equal(self.builds, [path, path, path])
+
+    def test_max_size(self):
+        json = join(DATADIR, 'DataTypesLibrary.json')
+        xml = join(DATADIR, 'DataTypesLibrary.xml')
+        for path in json, xml, json:
+            self.cache.get(path, self._build)
+        assert_equal(self.builds, [json, xml, json])
+
+    def test_disable_with_environment_variable(self):
+        path = join(DATADIR, 'DataTypesLibrary.json')
+        os.environ['ROBOT_LIBDOC_NOCACHE'] = 'true'
+        try:
+            self.cache.get(path, self._build)
+            self.cache.get(path, self._build)
+        finally:
+            del os.environ['ROBOT_LIBDOC_NOCACHE']
+        assert_equal(self.builds, [path, path])
+
+
 class TestLibdocTypedDictKeys(unittest.TestCase):
 
     def test_typed_dict_keys(self):
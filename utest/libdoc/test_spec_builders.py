@@ -0,0 +1,189 @@
+import importlib
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import contextmanager, ExitStack
+from os.path import dirname, join, normpath
+from pathlib import Path
+from unittest.mock import patch
+
+from robot.utils.asserts import assert_equal, assert_raises, assert_true
+from robot.libdocpkg import jsonbuilder, xmlbuilder
+
+
+CURDIR = dirname(__file__)
+DATADIR = normpath(join(CURDIR, '../../atest/testdata/libdoc/'))
+TEMPDIR = os.getenv('TEMPDIR') or tempfile.gettempdir()
+
+
+def is_installed(name):
+    try:
+        importlib.import_module(name)
+    except ImportError:
+        return False
+    return True
+
+
+class BackendTestCase(unittest.TestCase):
+    builder_class = None
+    backends = {}
+
+    def setUp(self):
+        self.nocache = os.environ.get('ROBOT_LIBDOC_NOCACHE')
+        os.environ['ROBOT_LIBDOC_NOCACHE'] = 'true'
+        self.temp_files = []
+
+    def tearDown(self):
+        if self.nocache is None:
+            del os.environ['ROBOT_LIBDOC_NOCACHE']
+        else:
+            os.environ['ROBOT_LIBDOC_NOCACHE'] = self.nocache
+        for path in self.temp_files:
+            os.remove(path)
+
+    def create_file(self, name, content):
+        path = join(TEMPDIR, name)
+        with open(path, 'w') as f:
+            f.write(content)
+        self.temp_files.append(path)
+        return path
+
+    def build(self, backend, path):
+        with self.use_backend(*self.backends[backend]):
+            result = self.builder_class().build(path).to_dictionary()
+        result['generated'] = None
+        return result
+
+    def verify_backends(self, path):
+        results = {}
+        for backend in self.backends:
+            if backend == 'fallback' or is_installed(backend):
+                results[backend] = self.build(backend, path)
+        for backend, result in results.items():
+            assert_equal(result, results['fallback'], backend)
+        return results['fallback']
+
+
+class TestJsonBuilderBackends(BackendTestCase):
+    builder_class = jsonbuilder.JsonDocBuilder
+    backends = {'simdjson': (),
+                'orjson': ('simdjson',),
+                'fallback': ('simdjson', 'orjson')}
+
+    @contextmanager
+    def use_backend(self, *blocked):
+        # Backend is selected when parsing based on module globals.
+        with ExitStack() as stack:
+            for name in blocked:
+                stack.enter_context(patch.object(jsonbuilder, name, None))
+            yield
+
+    def test_dynamic_library(self):
+        self.verify_backends(join(DATADIR, 'DynamicLibrary.json'))
+
+    def test_data_types(self):
+        self.verify_backends(join(DATADIR, 'DataTypesLibrary.json'))
+
+    @unittest.skipIf(not is_installed('simdjson'), 'Requires pysimdjson.')
+    def test_build_after_failure_with_simdjson(self):
+        path = self.create_file('libdoc-utest-invalid.json',
+                                '{"name": "Invalid"}')
+        # Keep the error alive so that it holds a reference to the parsed data.
+        error = assert_raises(KeyError, self.builder_class().build, path)
+        valid = join(DATADIR, 'DynamicLibrary.json')
+        libdoc = self.builder_class().build(valid)
+        assert_equal(libdoc.name, 'DynamicLibrary')
+        assert_true(isinstance(error, KeyError))
+
+
+class TestXmlBuilderBackends(BackendTestCase):
+    builder_class = xmlbuilder.XmlDocBuilder
+    backends = {'lxml': (),
+                'fallback': ('lxml', 'lxml.etree')}
+
+    @contextmanager
+    def use_backend(self, *blocked):
+        # Backend is selected at import time, so the module is reloaded so
+        # that importing blocked modules fails. Reloading updates module
+        # globals in place, so `builder_class` sees the selected backend.
+        if not blocked:
+            yield
+            return
+        saved = {name: sys.modules.get(name) for name in blocked}
+        sys.modules.update(dict.fromkeys(blocked))
+        try:
+            importlib.reload(xmlbuilder)
+        finally:
+            for name, original in saved.items():
+                if original:
+                    sys.modules[name] = original
+                else:
+                    sys.modules.pop(name)
+        try:
+            yield
+        finally:
+            importlib.reload(xmlbuilder)
+
+    def test_data_types(self):
+        self.verify_backends(join(DATADIR, 'DataTypesLibrary.xml'))
+
+    def test_libspec(self):
+        self.verify_backends(join(DATADIR, 'DataTypesLibrary.libspec'))
+
+    def test_example_spec(self):
+        self.verify_backends(join(DATADIR, 'ExampleSpec.xml'))
+
+    def test_empty_elements(self):
+        path = self.create_file('libdoc-utest-empty-elements.xml', '''\
+<?xml version="1.0" encoding="UTF-8"?>
+<keywordspec name="Empty" type="LIBRARY" format="ROBOT" scope="GLOBAL" specversion="4">
+<version/>
+<doc/>
+<keywords>
+<kw name="Keyword">
+<arguments>
+<arg kind="POSITIONAL_OR_NAMED"><name>arg</name><type/></arg>
+</arguments>
+<doc/>
+<shortdoc/>
+<tags><tag/><tag>tag</tag></tags>
+</kw>
+</keywords>
+<datatypes>
+<enums>
+<enum name="Color"><doc/><members><member name="RED"/><member name="GREEN" value="2"/></members></enum>
+</enums>
+<typeddicts>
+<typeddict name="Dict"><doc/><items><item key="key"/></items></typeddict>
+</typeddicts>
+</datatypes>
+</keywordspec>
+''')
+        result = self.verify_backends(path)
+        keyword = result['keywords'][0]
+        assert_equal(keyword['tags'], ['tag'])
+        assert_equal(keyword['args'][0]['types'], ['None'])
+        assert_equal(result['dataTypes']['enums'][0]['members'],
+                     [{'name': 'RED', 'value': None},
+                      {'name': 'GREEN', 'value': '2'}])
+        assert_equal(result['dataTypes']['typedDicts'][0]['items'],
+                     [{'key': 'key', 'type': None}])
+
+    @unittest.skipIf(not is_installed('lxml'), 'Requires lxml.')
+    def test_external_entities_are_not_resolved_with_lxml(self):
+        secret = self.create_file('libdoc-utest-secret.txt', 'SECRET')
+        path = self.create_file('libdoc-utest-entities.xml', f'''\
+<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE keywordspec [<!ENTITY secret SYSTEM "{Path(secret).as_uri()}">]>
+<keywordspec name="Entities" type="LIBRARY" format="ROBOT" scope="GLOBAL" specversion="4">
+<version/>
+<doc>Doc &secret;</doc>
+</keywordspec>
+''')
+        result = self.build('lxml', path)
+        assert_equal(result['doc'], 'Doc ')
+
+
+if __name__ == '__main__':
+    unittest.main()